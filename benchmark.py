@@ -0,0 +1,71 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import timeit
+import numpy as np
+import pygame
+import src.PyRenderLab as pyrenderlab
+
+# Compares `fill_triangles` and `Game.fill_objects` with drawing every face with `pygame.draw.polygon`.
+# Batching wins when there are many small triangles, where calling pygame once per face is what costs the most.
+# A few large triangles are slower than with pygame, which fills them faster than NumPy can.
+REPEAT = 20
+
+
+def measure(function):
+    return min(timeit.repeat(function, number=1, repeat=REPEAT)) * 1000
+
+
+def compare(name, flat, baseline):
+    flat_time, baseline_time = measure(flat), measure(baseline)
+    print(f"{name:<40} flat fill {flat_time:8.2f} ms    pygame.draw {baseline_time:8.2f} ms    "
+          f"{baseline_time / flat_time:5.2f}x")
+
+
+def cubes(game, count, size):
+    rng = np.random.default_rng(0)
+    shapes = []
+    for _ in range(count):
+        position = [rng.uniform(0, 800), rng.uniform(0, 600), rng.uniform(-20, 20)]
+        shape = pyrenderlab.Cube(game, size, tuple(rng.integers(0, 256, 3)), position=position)
+        shape.angle_x, shape.angle_y = rng.uniform(0, np.pi, 2)
+        shapes.append(shape)
+    return shapes
+
+
+def compare_triangles(game, name, triangles):
+    compare(
+        name,
+        lambda: pyrenderlab.fill_triangles(game.screen, triangles, (255, 0, 0)),
+        lambda: [pygame.draw.polygon(game.screen, (255, 0, 0), triangle) for triangle in triangles]
+    )
+
+
+def compare_frame(game, name, shapes):
+    game.add_objects(shapes)
+    compare(name, game.fill_objects, lambda: [shape.draw() for shape in shapes])
+
+
+def main():
+    game = pyrenderlab.Game(flat_fill=True, light_direction=(0.3, -0.5, 1))
+    rng = np.random.default_rng(0)
+
+    for count, size in ((20000, 3), (20000, 6), (5000, 10)):
+        triangles = rng.uniform(0, 800, (count, 1, 2)) + rng.uniform(-size, size, (count, 3, 2))
+        compare_triangles(game, f"fill_triangles, {count} triangles of {size} px", triangles)
+
+    # Only the triangles facing the viewer, the ones that `Game.fill_objects` draws
+    parts = [shape.triangulate() for shape in cubes(game, 200, 20)]
+    triangles = np.concatenate([part[0] for part in parts])
+    solids = np.concatenate([part[1] for part in parts])
+    normals = np.cross(solids[:, 1] - solids[:, 0], solids[:, 2] - solids[:, 0])
+    triangles = triangles[np.einsum('ij,ij->i', normals, solids.mean(axis=1)) * normals[:, 2] > 0]
+    compare_triangles(game, f"fill_triangles, {len(triangles)} cube triangles", triangles)
+    compare_triangles(game, "fill_triangles, 1 half-screen triangle", [[(0, 0), (800, 0), (0, 600)]])
+
+    for count, size in ((2000, 6), (1000, 10), (200, 20)):
+        compare_frame(game, f"Game frame, {count} cubes of {size} px", cubes(game, count, size))
+    compare_frame(game, "Game frame, 1 cube of 400 px", [pyrenderlab.Cube(game, 400)])
+
+
+if __name__ == "__main__":
+    main()
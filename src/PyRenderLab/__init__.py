@@ -23,6 +23,289 @@ def inform(message: str, exit_code=-1):
     sys.exit(exit_code)
 
 
+def fill_triangles(surface: pygame.Surface, triangles, colors, tile_size: int = FILL_TILE_SIZE,
+                   lines=None, line_colors=(0, 0, 0), line_widths=1, line_positions=None):
+    """
+    Fill many flat-colored triangles at once, writing directly into the pixels of the surface.
+    The triangles are drawn in order, so later triangles are painted over earlier ones.
+
+    A pixel is covered by a triangle when its center is inside it,
+    whatever the size of the triangle and whatever else is drawn.
+    The edge functions of all the triangles are solved for every row of their bounding boxes at once.
+    The square tiles that a triangle covers completely are filled as a whole, and only the pixels around its edges one by one.
+    Every pixel keeps the last triangle or line that covers it, and all the pixels are written at the end.
+
+    Args:
+        surface (pygame.Surface): The surface to draw on.
+        triangles (Array): The screen coordinates of the triangles, as an array of shape (N, 3, 2).
+        colors (Array): A single RGB color, or one RGB color for every triangle as an array of shape (N, 3).
+        tile_size (int): The width and height of the tiles that are filled as a whole.
+        lines (Array): Lines to draw along with the triangles, as an array of shape (M, 2, 2).
+        line_colors (Array): A single RGB color, or one RGB color for every line as an array of shape (M, 3).
+        line_widths (Array): The width of all lines, or of every line as an array of shape (M,).
+        line_positions (Array): The number of triangles drawn before every line, as an array of shape (M,).
+            By default the lines are drawn last.
+
+    Raises:
+        A ValueError will be raised if the triangles, lines or colors have the wrong shape,
+        or if the tile size is not a positive integer.
+    """
+    triangles = np.asarray(triangles, dtype=np.float64)
+    if triangles.ndim != 3 or triangles.shape[1:] != (3, 2):
+        raise ValueError(INVALID_TRIANGLES_SHAPE)
+    try:
+        colors = np.broadcast_to(np.asarray(colors, dtype=np.uint8), (len(triangles), 3))
+    except ValueError:
+        raise ValueError(INVALID_TRIANGLE_COLORS_SHAPE)
+    if not isinstance(tile_size, int) or isinstance(tile_size, bool) or tile_size < 1:
+        raise ValueError(INVALID_TILE_SIZE)
+    lines = np.zeros((0, 2, 2)) if lines is None else np.asarray(lines, dtype=np.float64)
+    if lines.ndim != 3 or lines.shape[1:] != (2, 2):
+        raise ValueError(INVALID_LINES_SHAPE)
+    try:
+        line_colors = np.broadcast_to(np.asarray(line_colors, dtype=np.uint8), (len(lines), 3))
+        line_widths = np.broadcast_to(np.asarray(line_widths, dtype=int), (len(lines),))
+        line_positions = len(triangles) if line_positions is None else np.asarray(line_positions)
+        line_positions = np.broadcast_to(line_positions, (len(lines),))
+    except ValueError:
+        raise ValueError(INVALID_LINES_SHAPE)
+
+    # The rank of every triangle and line in the drawing order. Lines come right before the triangle at their position
+    keys = np.r_[np.arange(len(triangles)), line_positions - 0.5]
+    order = np.argsort(keys, kind='stable')
+    ranks = np.empty(len(order), dtype=np.int32)
+    ranks[order] = np.arange(len(order), dtype=np.int32)
+    all_colors = np.concatenate([colors, line_colors])[order]
+    if surface.get_bytesize() == 3:
+        values = all_colors
+    elif surface.get_bytesize() == 1:
+        # Palette surfaces look up the closest color of their palette
+        packed = all_colors.astype(np.uint32) @ np.array([65536, 256, 1], dtype=np.uint32)
+        unique, inverse = np.unique(packed, return_inverse=True)
+        values = np.array([surface.map_rgb((int(color) >> 16, int(color) >> 8 & 255, int(color) & 255)) for color in unique],
+                          dtype=np.uint8)[inverse.reshape(-1)]
+    else:
+        # The same packing as `Surface.map_rgb`, for every color at once
+        shifts, losses = np.array(surface.get_shifts()[:3]), np.array(surface.get_losses()[:3])
+        values = np.bitwise_or.reduce((all_colors.astype(np.int64) >> losses) << shifts, axis=1) | surface.get_masks()[3]
+        values = values.astype(f'u{surface.get_bytesize()}')
+
+    # Make every triangle counter-clockwise so that its inside is where all edge functions are positive
+    edge_a = triangles[:, 1] - triangles[:, 0]
+    edge_b = triangles[:, 2] - triangles[:, 0]
+    area = edge_a[:, 0] * edge_b[:, 1] - edge_a[:, 1] * edge_b[:, 0]
+    triangles = triangles.copy()
+    triangles[area < 0, 1:] = triangles[area < 0, :0:-1]
+
+    # Bounding boxes of the pixels whose centers may be covered, clipped to the surface
+    width, height = surface.get_size()
+    low = np.ceil(triangles.min(axis=1) - 0.5).astype(int)
+    high = np.floor(triangles.max(axis=1) - 0.5).astype(int) + 1
+    x_min, y_min = np.clip(low, 0, (width, height)).T
+    x_max, y_max = np.clip(high, 0, (width, height)).T
+    visible = np.flatnonzero((area != 0) & (x_min < x_max) & (y_min < y_max))
+
+    spans, tiles = _full_tiles(_triangle_spans(triangles, visible, x_min, x_max, y_min, y_max), tile_size)
+    line_pixels = _line_pixels(lines, line_widths, width, height)
+    _fill_pixels(surface, spans, tiles, line_pixels, ranks, len(triangles), values, tile_size)
+
+
+def _triangle_spans(triangles, indices, x_min, x_max, y_min, y_max):
+    """
+    Find the span of pixels that every triangle covers on every row of its bounding box.
+
+    Returns:
+        A tuple with the triangle, the y, the first x and the length of every span, row after row for every triangle.
+    """
+    # Every edge that is not horizontal bounds the pixel centers on a row from the left or from the right, at x = p*y + q
+    start = triangles[indices]
+    end = np.roll(start, -1, axis=1)
+    a = (start[:, :, 1] - end[:, :, 1]).T
+    b = (end[:, :, 0] - start[:, :, 0]).T
+    c = (-(a.T * start[:, :, 0] + b.T * start[:, :, 1])).T
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p = np.where(a != 0, -b / a, 0)
+        q = -(c + b / 2) / a - 0.5
+    lefts = np.where(a > 0, q, -np.inf)
+    rights = np.where(a < 0, q, np.inf)
+
+    heights = y_max[indices] - y_min[indices]
+    rows = np.repeat(np.arange(len(indices)), heights)
+    ys = y_min[indices][rows] + np.arange(len(rows)) - np.repeat(np.cumsum(heights) - heights, heights)
+    lows = x_min[indices][rows].astype(np.float64)
+    highs = x_max[indices][rows].astype(np.float64)
+    for edge in range(3):
+        bounds = p[edge, rows] * ys
+        np.maximum(lows, np.ceil(bounds + lefts[edge, rows]), out=lows)
+        np.minimum(highs, np.floor(bounds + rights[edge, rows]) + 1, out=highs)
+    lengths = np.maximum(highs - lows, 0).astype(np.int32)
+    return indices[rows], ys, lows.astype(np.int32), lengths
+
+
+def _full_tiles(spans, size):
+    """
+    Find the square tiles that every triangle covers completely, and cut them out of its spans.
+
+    Returns:
+        A tuple with the spans around the tiles, in the same form as the spans of `_triangle_spans`,
+        and a tuple with the triangle, the column and the row of every tile.
+    """
+    span_triangles, ys, lows, lengths = spans
+    if not len(ys):
+        return spans, (span_triangles, ys, ys)
+    highs = lows + lengths
+
+    # A tile is covered when every row of its band of rows covers it
+    bands = ys // size
+    firsts = np.flatnonzero(np.r_[True, (span_triangles[1:] != span_triangles[:-1]) | (bands[1:] != bands[:-1])])
+    rows = np.diff(np.r_[firsts, len(ys)])
+    lefts = -(-np.maximum.reduceat(lows, firsts) // size)
+    rights = np.minimum.reduceat(highs, firsts) // size
+    counts = np.where(rows == size, np.maximum(rights - lefts, 0), 0)
+
+    # The rest of every span is left of the tiles and right of them
+    tiled = np.repeat(counts > 0, rows)
+    cut_start = np.where(tiled, np.repeat(lefts * size, rows), highs)
+    cut_end = np.where(tiled, np.repeat(rights * size, rows), highs)
+    spans = (
+        np.r_[span_triangles, span_triangles],
+        np.r_[ys, ys],
+        np.r_[lows, cut_end].astype(np.int32),
+        np.r_[cut_start - lows, highs - cut_end].astype(np.int32)
+    )
+
+    tile_bands = np.repeat(np.arange(len(firsts)), counts)
+    columns = lefts[tile_bands] + np.arange(len(tile_bands)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return spans, (span_triangles[firsts][tile_bands], columns, bands[firsts][tile_bands])
+
+
+def _line_pixels(lines, widths, width, height):
+    """
+    Find the pixels of every line, one step at a time along its longer axis, like `pygame.draw.line`.
+
+    Returns:
+        A tuple with the line, the x and the y of every pixel.
+    """
+    # Wider lines are repeated side by side, across their longer axis
+    line_widths = np.maximum(widths, 0)
+    copies = np.repeat(np.arange(len(lines)), line_widths)
+    offsets = np.arange(len(copies)) - np.repeat(np.cumsum(line_widths) - line_widths, line_widths)
+    offsets -= (line_widths[copies] - 1) // 2
+    (start_x, start_y), (end_x, end_y) = lines[copies].transpose(1, 2, 0)
+    delta_x, delta_y = end_x - start_x, end_y - start_y
+    steep = np.abs(delta_y) > np.abs(delta_x)
+    start_x += np.where(steep, offsets, 0)
+    start_y += np.where(steep, 0, offsets)
+
+    steps = np.ceil(np.maximum(np.abs(delta_x), np.abs(delta_y))).astype(int) + 1
+    pixel_lines = np.repeat(np.arange(len(copies)), steps)
+    fractions = np.arange(len(pixel_lines)) - np.repeat(np.cumsum(steps) - steps, steps)
+    fractions = fractions / np.maximum(steps - 1, 1)[pixel_lines]
+    xs = np.floor(start_x[pixel_lines] + fractions * delta_x[pixel_lines]).astype(int)
+    ys = np.floor(start_y[pixel_lines] + fractions * delta_y[pixel_lines]).astype(int)
+    inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+    return copies[pixel_lines][inside], xs[inside], ys[inside]
+
+
+def _fill_pixels(surface, spans, tiles, line_pixels, ranks, count, values, size):
+    """
+    Fill the spans and tiles of the triangles and the pixels of the lines,
+    giving every pixel the value of the last of them covering it.
+    """
+    span_triangles, span_ys, span_xs, lengths = spans
+    tile_triangles, tile_columns, tile_rows = tiles
+    pixel_lines, pixel_xs, pixel_ys = line_pixels
+    drawn = lengths > 0
+    span_triangles, span_ys, span_xs, lengths = span_triangles[drawn], span_ys[drawn], span_xs[drawn], lengths[drawn]
+    if not len(lengths) and not len(tile_rows) and not len(pixel_xs):
+        return
+
+    # The part of the surface that is drawn on, made of whole tiles when there are any
+    step = size if len(tile_rows) else 1
+    top = np.r_[span_ys, pixel_ys, tile_rows * size].min() // step * step
+    bottom = -(-np.r_[span_ys + 1, pixel_ys + 1, (tile_rows + 1) * size].max() // step) * step
+    left = np.r_[span_xs, pixel_xs, tile_columns * size].min() // step * step
+    right = -(-np.r_[span_xs + lengths, pixel_xs + 1, (tile_columns + 1) * size].max() // step) * step
+    stride = right - left
+    owner = np.full((bottom - top) * stride, -1, dtype=np.int32)
+
+    # Pixels are handled in batches, as offsets into `owner` with the rank of what covers them
+    starts = ((span_ys - top) * stride + span_xs - left).astype(np.int32)
+    firsts = np.cumsum(lengths) - lengths
+    splits = np.searchsorted(firsts, np.arange(FILL_BATCH_SIZE, lengths.sum(), FILL_BATCH_SIZE))
+
+    def batches():
+        for first, last in zip(np.r_[0, splits], np.r_[splits, len(lengths)]):
+            batch = lengths[first:last]
+            pixels = np.repeat(starts[first:last] - (np.cumsum(batch, dtype=np.int32) - batch), batch)
+            pixels += np.arange(len(pixels), dtype=np.int32)
+            yield pixels, np.repeat(ranks[span_triangles[first:last]], batch)
+        yield ((pixel_ys - top) * stride + pixel_xs - left).astype(np.int32), ranks[count + pixel_lines]
+
+    cached = list(batches()) if lengths.sum() <= FILL_BATCH_SIZE else None
+    for pixels, pixel_ranks in cached or batches():
+        np.maximum.at(owner, pixels, pixel_ranks)
+
+    # Every tile keeps the last triangle covering it as a whole
+    if len(tile_rows):
+        tile_owner = np.full(((bottom - top) // size, stride // size), -1, dtype=np.int32)
+        np.maximum.at(tile_owner, (tile_rows - top // size, tile_columns - left // size), ranks[tile_triangles])
+    dense = len(owner) <= 4 * (lengths.sum() + len(pixel_xs))
+    if len(tile_rows) and dense:
+        blocks = owner.reshape(len(tile_owner), size, -1, size)
+        np.maximum(blocks, tile_owner[:, None, :, None], out=blocks)
+
+    width, height = surface.get_size()
+    if surface.get_bytesize() == 3:
+        surface_pixels = pygame.surfarray.pixels3d(surface)
+    else:
+        surface_pixels = pygame.surfarray.pixels2d(surface)
+    try:
+        target = surface_pixels.swapaxes(0, 1)[top:min(bottom, height), left:min(right, width)]
+        extra = [1] * (target.ndim - 2)
+        # Surfaces that are mostly covered one pixel at a time are written whole, a batch of rows at a time
+        if dense:
+            block = owner.reshape(-1, stride)[:target.shape[0], :target.shape[1]]
+            batch = max(FILL_BATCH_SIZE // stride, 1)
+            for first in range(0, len(block), batch):
+                rows = block[first:first + batch]
+                covered = (rows >= 0).reshape(*rows.shape, *extra)
+                np.copyto(target[first:first + batch], values.take(rows, axis=0, mode='wrap'), where=covered)
+            return
+
+        # Otherwise the tiles are written whole, and then the other pixels one by one, unless a tile covers them later
+        if len(tile_rows):
+            inner = tile_owner[:target.shape[0] // size, :target.shape[1] // size]
+            tiled = target[:inner.shape[0] * size, :inner.shape[1] * size]
+            tiled = tiled.reshape(inner.shape[0], size, inner.shape[1], size, *target.shape[2:])
+            np.copyto(tiled, values.take(inner, axis=0, mode='wrap')[:, None, :, None],
+                      where=(inner >= 0).reshape(inner.shape[0], 1, inner.shape[1], 1, *extra))
+        for pixels, _ in cached or batches():
+            rows, columns = np.divmod(pixels, stride)
+            pixel_ranks = owner[pixels]
+            if len(tile_rows):
+                np.maximum(pixel_ranks, tile_owner[rows // size, columns // size], out=pixel_ranks)
+            target[rows, columns] = values[pixel_ranks]
+    finally:
+        del surface_pixels
+
+
+def _rotation_matrices(angles_x, angles_y, angles_z):
+    """
+    Build the rotation matrices of many shapes at once, the same as `Shape3D.calculations` does for one.
+
+    Returns:
+        An array of shape (N, 3, 3), that rotates the vertices of every shape when multiplied on their right.
+    """
+    cos_x, cos_y, cos_z = np.cos(angles_x), np.cos(angles_y), np.cos(angles_z)
+    sin_x, sin_y, sin_z = np.sin(angles_x), np.sin(angles_y), np.sin(angles_z)
+    zeros, ones = np.zeros_like(cos_x), np.ones_like(cos_x)
+    rotation_x = np.stack([ones, zeros, zeros, zeros, cos_x, -sin_x, zeros, sin_x, cos_x], axis=1).reshape(-1, 3, 3)
+    rotation_y = np.stack([cos_y, zeros, sin_y, zeros, ones, zeros, -sin_y, zeros, cos_y], axis=1).reshape(-1, 3, 3)
+    rotation_z = np.stack([cos_z, -sin_z, zeros, sin_z, cos_z, zeros, zeros, zeros, ones], axis=1).reshape(-1, 3, 3)
+    return rotation_x @ rotation_y @ rotation_z
+
+
 class Shape3D(ABC):
     """
     An Abstract Base Class for all 3D geometrical shapes in a game.
@@ -52,6 +335,27 @@ class Shape3D(ABC):
         self.rotation_z = np.array([])
         self.rotated_vertices = None
         self.projected_vertices = None
+        self.face_indices = []
+        self.triangle_indices = None
+        self.outline_indices = None
+        self.outline_triangles = None
+
+    @property
+    def fill_color(self):
+        """
+        The solid color of the faces of the shape, or None if the faces are not filled with a solid color.
+        """
+        if isinstance(self.texture, Iterable):
+            return self.texture
+        if self.texture.img_path:
+            return None
+        return self.texture.color or None
+
+    def build_vertices(self):
+        """
+        Build the vertices of the shape from its size and position.
+        """
+        pass
 
     def calculations(self):
         """
@@ -75,6 +379,48 @@ class Shape3D(ABC):
 
         self.projected_vertices = self.rotated_vertices[:, :2] + (self.x, self.y)
 
+    def build_triangles(self):
+        """
+        Split the faces of the shape into triangles, and find the faces on both sides of every edge of the outline.
+        The faces of a shape never change, so this only runs once.
+        """
+        triangles, face_triangles = [], {}
+        for face in map(tuple, self.face_indices):
+            for edge in zip(face, face[1:] + face[:1]):
+                face_triangles.setdefault(tuple(sorted(edge)), []).append(len(triangles))
+            triangles += [(face[0], face[i], face[i + 1]) for i in range(1, len(face) - 1)]
+        self.triangle_indices = np.array(triangles, dtype=int).reshape(-1, 3)
+        self.outline_indices = np.array(self.edges, dtype=int).reshape(-1, 2)
+        # Edges that are not on any face get -1, and are always drawn
+        edge_triangles = [(face_triangles.get(tuple(sorted(edge)), []) + [-1, -1])[:2] for edge in self.edges]
+        self.outline_triangles = np.array(edge_triangles, dtype=int).reshape(-1, 2)
+
+    def triangulate(self):
+        """
+        Split the faces of the shape into triangles.
+
+        Returns:
+            A tuple with the projected triangles as an array of shape (N, 3, 2), the same triangles in 3D around the
+            center of the shape as an array of shape (N, 3, 3), and the projected edges of the outline as an array of
+            shape (M, 2, 2). The triangles of the faces on both sides of every edge are in `outline_triangles`.
+        """
+        if self.triangle_indices is None:
+            self.build_triangles()
+        self.build_vertices()
+        self.calculations()
+        centered = self.rotated_vertices - self.rotated_vertices.mean(axis=0)
+        triangles = self.projected_vertices[self.triangle_indices]
+        return triangles, centered[self.triangle_indices], self.projected_vertices[self.outline_indices]
+
+    def draw_edges(self):
+        """
+        Draw the outline of the shape.
+        """
+        for edge in self.edges:
+            start = self.projected_vertices[edge[0]]
+            end = self.projected_vertices[edge[1]]
+            pygame.draw.line(self.game.screen, (0, 0, 0), start, end, self.line_height)
+
     def rotate(self, angle: int, value: Number):
         """
         Rotate the shape. It is recommended to use the angle attribute (.angle_x, .angle_y or .angle_z) instead.
@@ -107,7 +453,9 @@ class Game:
     """
     The class for the game itself
     """
-    def __init__(self, bg_color: ColorValue = None, update=None, size: Tuple[float, float] = (800, 600), window_title: str = None, icon_image: ImagePath = None) -> None:
+    def __init__(self, bg_color: ColorValue = None, update=None, size: Tuple[float, float] = (800, 600),
+                 window_title: str = None, icon_image: ImagePath = None, flat_fill: bool = False,
+                 light_direction: Position = None) -> None:
         """
         Initialize the game
 
@@ -117,6 +465,8 @@ class Game:
             size (Tuple[float, float]): The size of the game's window.
             window_title (str): The title of the game's window.
             icon_image (ImagePath): The icon of the game's window.
+            flat_fill (bool): Fill the solid-colored faces of all the objects together, with `fill_triangles`.
+            light_direction (Position): The direction towards the light, used for shading the faces when `flat_fill` is used.
         """
         self.keys = None
         self.mousex = None
@@ -144,6 +494,16 @@ class Game:
                 self.update = update
             else:
                 raise TypeError(INVALID_UPDATE_TYPE)
+        if not isinstance(flat_fill, bool):
+            raise TypeError(INVALID_FLAT_FILL_TYPE)
+        self.flat_fill = flat_fill
+        if light_direction is None:
+            self.light_direction = None
+        else:
+            light_direction = np.asarray(light_direction, dtype=np.float64)
+            if light_direction.shape != (3,) or not np.any(light_direction):
+                raise ValueError(INVALID_LIGHT_DIRECTION)
+            self.light_direction = light_direction / np.linalg.norm(light_direction)
         self.bg_color = (0, 0, 0) if bg_color is None else bg_color
         self.object_instances = []
         self.run = True
@@ -178,8 +538,11 @@ class Game:
                     self.stop()
             self.screen.fill(self.bg_color)
             try:
-                for i in self.object_instances:
-                    i.draw()
+                if self.flat_fill:
+                    self.fill_objects()
+                else:
+                    for i in self.object_instances:
+                        i.draw()
             except AttributeError:
                 pass
             if self.update is not None:
@@ -189,6 +552,90 @@ class Game:
             pygame.display.update()
             clock.tick(fps)
 
+    def fill_objects(self):
+        """
+        Draw the objects of the game from back to front, each with its faces first and its outline on top.
+        Every run of solid-colored objects between two objects with an image texture is filled with a single
+        `fill_triangles` call, and the objects with an image texture are drawn in between with their own `draw`.
+        Faces pointing away from the viewer are skipped, and so are the edges between two of them.
+        If `light_direction` is set, every face of a solid-colored object is shaded by how directly it faces the light.
+        """
+        objects = sorted(self.object_instances, key=lambda i: i.z)
+        fill_colors = [i.fill_color for i in objects]
+        filled, colors = [], []
+        for i, color in zip(objects, fill_colors):
+            if color is None:
+                self._fill_solid_objects(filled, colors)
+                filled, colors = [], []
+                i.draw()
+            else:
+                filled.append(i)
+                colors.append(color)
+        self._fill_solid_objects(filled, colors)
+
+    def _fill_solid_objects(self, filled, fill_colors):
+        """
+        Fill the faces and outlines of solid-colored objects with a single `fill_triangles` call.
+
+        Args:
+            filled (list): The objects to fill, from back to front.
+            fill_colors (list): The fill color of every object.
+        """
+        if not filled:
+            return
+
+        # The same as `Shape3D.triangulate` for every object, with all the objects rotated together
+        for i in filled:
+            if i.triangle_indices is None:
+                i.build_triangles()
+            i.build_vertices()
+        vertices = [np.asarray(i.vertices, dtype=np.float64) for i in filled]
+        vertex_counts = np.array([len(v) for v in vertices])
+        firsts = np.cumsum(vertex_counts) - vertex_counts
+        placements = [(i.angle_x, i.angle_y, i.angle_z, i.x, i.y) for i in filled]
+        angles_x, angles_y, angles_z, xs, ys = np.array(placements, dtype=np.float64).T
+        rotations = np.repeat(_rotation_matrices(angles_x, angles_y, angles_z), vertex_counts, axis=0)
+        rotated = (np.concatenate(vertices)[:, None] @ rotations)[:, 0]
+        centered = rotated - np.repeat(np.add.reduceat(rotated, firsts) / vertex_counts[:, None], vertex_counts, axis=0)
+        projected = rotated[:, :2] + np.repeat(np.c_[xs, ys], vertex_counts, axis=0)
+
+        counts = np.array([len(i.triangle_indices) for i in filled])
+        outline_counts = np.array([len(i.outline_indices) for i in filled])
+        triangle_indices = np.concatenate([i.triangle_indices for i in filled]) + np.repeat(firsts, counts)[:, None]
+        outline_indices = np.concatenate([i.outline_indices for i in filled]) + np.repeat(firsts, outline_counts)[:, None]
+        triangles, solids, outlines = projected[triangle_indices], centered[triangle_indices], projected[outline_indices]
+        outline_triangles = np.concatenate([i.outline_triangles for i in filled])
+        triangle_firsts = np.repeat(np.cumsum(counts) - counts, outline_counts)[:, None]
+        outline_triangles = np.where(outline_triangles >= 0, outline_triangles + triangle_firsts, len(triangles))
+
+        # Outward unit normals, pointing away from the center of their shape
+        normals = np.cross(solids[:, 1] - solids[:, 0], solids[:, 2] - solids[:, 0])
+        normals[np.einsum('ij,ij->i', normals, solids.mean(axis=1)) < 0] *= -1
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        normals = np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+        front = normals[:, 2] > 0
+
+        colors = np.repeat(np.array([pygame.Color(color)[:3] for color in fill_colors], dtype=np.float64), counts, axis=0)
+        if self.light_direction is not None:
+            colors *= AMBIENT_LIGHT + (1 - AMBIENT_LIGHT) * np.clip(normals @ self.light_direction, 0, 1)[:, None]
+
+        # The objects are already from back to front, so only the faces of every object are sorted
+        objects = np.repeat(np.arange(len(filled)), counts)[front]
+        order = np.lexsort((solids[front, :, 2].mean(axis=1), objects))
+
+        # The outline of every object is drawn right after its faces
+        shown = np.r_[front, True][outline_triangles].any(axis=1)
+        outline_objects = np.repeat(np.arange(len(filled)), outline_counts)[shown]
+        positions = np.searchsorted(objects, outline_objects, side='right')
+        fill_triangles(
+            self.screen,
+            triangles[front][order],
+            np.rint(colors[front][order]).astype(np.uint8),
+            lines=outlines[shown],
+            line_widths=np.repeat([i.line_height for i in filled], outline_counts)[shown],
+            line_positions=positions
+        )
+
     def stop(self):
         """
         Stop the game
@@ -245,19 +692,26 @@ class Cube(Shape3D):
             (4, 5), (5, 7), (7, 6), (6, 4),
             (0, 4), (1, 5), (2, 6), (3, 7)
         ]
+        self.face_indices = [(0, 1, 3, 2), (4, 5, 7, 6), (0, 4, 6, 2), (1, 5, 7, 3), (0, 1, 5, 4), (2, 3, 7, 6)]
         self.angle_x = 0
         self.angle_y = 0
         self.angle_z = 0
         self.vertices = np.array([])
 
+    def build_vertices(self):
+        """
+        Build the vertices of the cube from its size and position.
+        """
+        self.vertices = np.array([[x, y, z] for x in ((self.size+self.z)/2, -(self.size+self.z)/2) for y in ((self.size+self.z)/2, -(self.size+self.z)/2) for z in ((self.size+self.z)/2, -(self.size+self.z)/2)])
+
     def draw(self):
         """
         Draws the shape.
         """
-        self.vertices = np.array([[x, y, z] for x in ((self.size+self.z)/2, -(self.size+self.z)/2) for y in ((self.size+self.z)/2, -(self.size+self.z)/2) for z in ((self.size+self.z)/2, -(self.size+self.z)/2)])
+        self.build_vertices()
         super().calculations()
         faces = [
-            [self.projected_vertices[i] for i in face] for face in [(0, 1, 3, 2), (4, 5, 7, 6), (0, 4, 6, 2), (1, 5, 7, 3), (0, 1, 5, 4), (2, 3, 7, 6)]
+            [self.projected_vertices[i] for i in face] for face in self.face_indices
         ]
 
         for face in faces:
@@ -272,10 +726,7 @@ class Cube(Shape3D):
                 elif self.texture.color:
                     pygame.draw.polygon(self.game.screen, self.texture.color, face)
 
-        for edge in self.edges:
-            start = self.projected_vertices[edge[0]]
-            end = self.projected_vertices[edge[1]]
-            pygame.draw.line(self.game.screen, (0, 0, 0), start, end, self.line_height)
+        self.draw_edges()
 
     def __repr__(self) -> str:
         """
@@ -305,14 +756,21 @@ class Prism(Shape3D):
             (3, 4), (4, 5), (5, 3),
             (0, 3), (1, 4), (2, 5),
         ]
+        self.face_indices = [
+            (0, 1, 2),
+            (3, 4, 5),
+            (0, 1, 4, 3),
+            (1, 2, 5, 4),
+            (0, 2, 5, 3)
+        ]
         self.velocity = 0.05
         self.angle_x = 0
         self.angle_y = 0
         self.angle_z = 0
 
-    def draw(self):
+    def build_vertices(self):
         """
-        Draw the shape
+        Build the vertices of the prism from its size and position.
         """
         self.vertices = np.array([
             [-(self.size+self.z)/2, -(self.size+self.z)/3, -(self.size+self.z)/2],
@@ -322,15 +780,15 @@ class Prism(Shape3D):
             [(self.size+self.z)/2, -(self.size+self.z)/3, (self.size+self.z)/2],
             [0, (self.size+self.z)/3, (self.size+self.z)/2]
         ])
+
+    def draw(self):
+        """
+        Draw the shape
+        """
+        self.build_vertices()
         super().calculations()
         faces = [
-            [self.projected_vertices[i] for i in face] for face in [
-                (0, 1, 2),
-                (3, 4, 5),
-                (0, 1, 4, 3),
-                (1, 2, 5, 4),
-                (0, 2, 5, 3)
-            ]
+            [self.projected_vertices[i] for i in face] for face in self.face_indices
         ]
 
         for face in faces:
@@ -345,10 +803,7 @@ class Prism(Shape3D):
                 elif self.texture.color:
                     pygame.draw.polygon(self.game.screen, self.texture.color, face)
 
-        for edge in self.edges:
-            start = self.projected_vertices[edge[0]]
-            end = self.projected_vertices[edge[1]]
-            pygame.draw.line(self.game.screen, (0, 0, 0), start, end, self.line_height)
+        self.draw_edges()
 
     def __repr__(self) -> str:
         """
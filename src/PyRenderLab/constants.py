@@ -162,6 +162,11 @@ ANGLE_X = 0
 ANGLE_Y = 1
 ANGLE_Z = 2
 
+# Rendering
+FILL_TILE_SIZE = 16
+FILL_BATCH_SIZE = 16384
+AMBIENT_LIGHT = 0.2
+
 # Raise messages
 INVALID_OBJECT_TYPE = "Object must be a subclass of the `Shape3D` class"
 INVALID_OUTLINE_HEIGHT_TYPE = "`outline_height` must be an integer"
@@ -170,3 +175,9 @@ INVALID_UPDATE_ARGUMENTS = "The update function must have 1 argument (`keys`)"
 INVALID_ANGLE = "Please use either constants `ANGLE_X`, `ANGLE_Y` or `ANGLE_Z`"
 INVALID_SIZE_TYPE = "`size` must be a one-dimensional tuple with 2 items (width and height)"
 INVALID_WINDOW_TITLE_TYPE = "`window_title` must be a string"
+INVALID_FLAT_FILL_TYPE = "`flat_fill` must be a boolean"
+INVALID_LIGHT_DIRECTION = "`light_direction` must be a non-zero 3-dimensional vector"
+INVALID_TRIANGLES_SHAPE = "`triangles` must be an array of shape (N, 3, 2)"
+INVALID_TRIANGLE_COLORS_SHAPE = "`colors` must be a single color or an array of shape (N, 3)"
+INVALID_TILE_SIZE = "`tile_size` must be a positive integer"
+INVALID_LINES_SHAPE = "`lines` must be an array of shape (M, 2, 2), with matching `line_colors`, `line_widths` and `line_positions`"
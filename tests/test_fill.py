@@ -0,0 +1,158 @@
+import sys
+import os
+import re
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import unittest
+from unittest import mock
+import numpy as np
+import pygame
+import src.PyRenderLab as pyrenderlab
+
+# With tiles of 1 pixel every triangle is filled whole, and with tiles as large as the surface only pixel by pixel
+TILE_SIZES = (pyrenderlab.FILL_TILE_SIZE, 1, 1000)
+
+
+class TestFillTriangles(unittest.TestCase):
+    def setUp(self):
+        self.surface = pygame.Surface((100, 100), depth=32)
+
+    def test_fill_square(self):
+        # A 40x40 square split into 400 triangles covers every pixel once
+        corners = np.array([(x, y) for y in range(10, 50, 2) for x in range(10, 50, 2)])
+        triangles = np.concatenate([
+            np.stack([corners, corners + (2, 0), corners + (2, 2)], axis=1),
+            np.stack([corners, corners + (0, 2), corners + (2, 2)], axis=1)
+        ])
+        pyrenderlab.fill_triangles(self.surface, triangles, (255, 0, 0))
+        filled = pygame.surfarray.array3d(self.surface)[:, :, 0] == 255
+        self.assertEqual(filled.sum(), 1600)
+        self.assertTrue(filled[10:50, 10:50].all())
+
+    def test_fill_order(self):
+        for tile_size in TILE_SIZES:
+            with self.subTest(tile_size=tile_size):
+                triangles = [[(0, 0), (20, 0), (0, 20)], [(0, 0), (0, 20), (20, 0)]]
+                pyrenderlab.fill_triangles(self.surface, triangles, [(255, 0, 0), (0, 255, 0)], tile_size=tile_size)
+                self.assertEqual(tuple(self.surface.get_at((5, 5)))[:3], (0, 255, 0))
+
+    def test_same_coverage(self):
+        # A triangle covers the same pixels whatever the tile size and whatever else is drawn
+        surface = pygame.Surface((200, 100), depth=32)
+        rng = np.random.default_rng(0)
+        triangles = rng.uniform(15, 85, (20, 1, 2)) + rng.uniform(-15, 15, (20, 3, 2))
+        colors = rng.integers(0, 256, (20, 3))
+        expected = None
+        for tile_size in TILE_SIZES:
+            for others in (0, 1, 500):
+                with self.subTest(tile_size=tile_size, others=others):
+                    # The other triangles are drawn on the right half of the surface, away from the compared pixels
+                    others_triangles = rng.uniform((120, 10), (190, 90), (others, 1, 2)) + rng.uniform(-10, 10, (others, 3, 2))
+                    surface.fill((0, 0, 0))
+                    all_triangles = np.concatenate([triangles, others_triangles])
+                    all_colors = np.concatenate([colors, np.full((others, 3), 255)])
+                    pyrenderlab.fill_triangles(surface, all_triangles, all_colors, tile_size=tile_size)
+                    pixels = pygame.surfarray.array3d(surface)[:105]
+                    if expected is None:
+                        expected = pixels
+                    np.testing.assert_array_equal(pixels, expected)
+
+    def test_fill_off_screen(self):
+        pyrenderlab.fill_triangles(self.surface, [[(-50, -50), (500, -50), (-50, 500)]], (255, 0, 0))
+        self.assertTrue((pygame.surfarray.array3d(self.surface)[:, :, 0] == 255).all())
+
+    def test_fill_24_bit(self):
+        surface = pygame.Surface((100, 100), depth=24)
+        pyrenderlab.fill_triangles(surface, np.repeat([[(0, 0), (20, 0), (0, 20)]], 300, axis=0), (255, 128, 0))
+        self.assertEqual(tuple(surface.get_at((5, 5)))[:3], (255, 128, 0))
+
+    def test_line_positions(self):
+        triangles = [[(0, 0), (20, 0), (0, 20)]]
+        for tile_size in TILE_SIZES:
+            for position, color in ((0, (255, 0, 0)), (1, (0, 0, 0))):
+                with self.subTest(tile_size=tile_size, position=position):
+                    pyrenderlab.fill_triangles(self.surface, triangles, (255, 0, 0), tile_size=tile_size,
+                                               lines=[[(0, 5), (15, 5)]], line_positions=[position])
+                    self.assertEqual(tuple(self.surface.get_at((5, 5)))[:3], color)
+
+
+class TestFillObjects(unittest.TestCase):
+    def test_fill_objects(self):
+        game = pyrenderlab.Game(flat_fill=True, light_direction=(0, 0, 1))
+        cube = pyrenderlab.Cube(game, 100, (0, 0, 255))
+        game.add_objects([cube])
+        game.fill_objects()
+        self.assertEqual(tuple(game.screen.get_at((int(cube.x), int(cube.y))))[:3], (0, 0, 255))
+
+    def test_back_face_culling(self):
+        game = pyrenderlab.Game(flat_fill=True)
+        cube = pyrenderlab.Cube(game, 100, (0, 0, 255))
+        game.add_objects([cube])
+        for angle, count in ((0, 2), (np.pi / 4, 4)):
+            cube.angle_y = angle
+            with self.subTest(angle=angle), mock.patch.object(pyrenderlab, 'fill_triangles') as fill_triangles:
+                game.fill_objects()
+                self.assertEqual(len(fill_triangles.call_args.args[1]), count)
+
+    def test_lambert_shading(self):
+        game = pyrenderlab.Game(flat_fill=True, light_direction=(0, 0, 1))
+        cube = pyrenderlab.Cube(game, 100, (0, 0, 255))
+        cube.angle_y = np.pi / 4
+        game.add_objects([cube])
+        game.fill_objects()
+        shade = round(255 * (pyrenderlab.AMBIENT_LIGHT + (1 - pyrenderlab.AMBIENT_LIGHT) * np.cos(np.pi / 4)))
+        self.assertEqual(tuple(game.screen.get_at((int(cube.x) + 20, int(cube.y))))[:3], (0, 0, shade))
+
+    def test_back_to_front(self):
+        game = pyrenderlab.Game(flat_fill=True)
+        game.add_objects([
+            pyrenderlab.Cube(game, 100, (0, 255, 0), position=[400, 300, 50]),
+            pyrenderlab.Cube(game, 100, (255, 0, 0), position=[400, 300, -50])
+        ])
+        game.fill_objects()
+        self.assertEqual(tuple(game.screen.get_at((400, 300)))[:3], (0, 255, 0))
+
+    def test_textured_depth_order(self):
+        # An object with an image texture is drawn at its place from back to front, between the solid-colored objects
+        for z, color in ((-50, (255, 0, 0)), (50, (0, 0, 255))):
+            with self.subTest(z=z):
+                game = pyrenderlab.Game(flat_fill=True)
+                textured = pyrenderlab.Cube(game, 100, pyrenderlab.Texture(img_path='image.png'), position=[400, 300, z])
+                game.add_objects([textured, pyrenderlab.Cube(game, 100, (255, 0, 0), position=[400, 300, 0])])
+                with mock.patch.object(textured, 'draw', lambda: game.screen.fill((0, 0, 255))):
+                    game.fill_objects()
+                self.assertEqual(tuple(game.screen.get_at((400, 300)))[:3], color)
+
+    def test_overlapping_outlines(self):
+        # The outline of the cube behind runs through the cube in front, and must be hidden by it
+        game = pyrenderlab.Game(flat_fill=True)
+        game.add_objects([
+            pyrenderlab.Cube(game, 100, (255, 0, 0), position=[400, 300, -50]),
+            pyrenderlab.Cube(game, 100, (0, 255, 0), position=[420, 300, 50])
+        ])
+        game.fill_objects()
+        self.assertEqual(tuple(game.screen.get_at((425, 300)))[:3], (0, 255, 0))
+
+
+class TestRaises(unittest.TestCase):
+    def setUp(self):
+        self.game = pyrenderlab.Game()
+
+    def test_triangles_shape_raise(self):
+        with self.assertRaisesRegex(ValueError, re.escape(pyrenderlab.INVALID_TRIANGLES_SHAPE)):
+            pyrenderlab.fill_triangles(self.game.screen, np.zeros((2, 4, 2)), (255, 0, 0))
+
+    def test_colors_shape_raise(self):
+        with self.assertRaisesRegex(ValueError, re.escape(pyrenderlab.INVALID_TRIANGLE_COLORS_SHAPE)):
+            pyrenderlab.fill_triangles(self.game.screen, np.zeros((2, 3, 2)), np.zeros((3, 3)))
+
+    def test_tile_size_raise(self):
+        with self.assertRaisesRegex(ValueError, re.escape(pyrenderlab.INVALID_TILE_SIZE)):
+            pyrenderlab.fill_triangles(self.game.screen, np.zeros((2, 3, 2)), (255, 0, 0), tile_size=0)
+
+    def test_lines_shape_raise(self):
+        with self.assertRaisesRegex(ValueError, re.escape(pyrenderlab.INVALID_LINES_SHAPE)):
+            pyrenderlab.fill_triangles(self.game.screen, np.zeros((2, 3, 2)), (255, 0, 0), lines=np.zeros((2, 3, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
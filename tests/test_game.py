@@ -17,6 +17,14 @@ class TestRaises(unittest.TestCase):
         with self.assertRaisesRegex(TypeError, pyrenderlab.INVALID_UPDATE_TYPE):
             self.new_game = pyrenderlab.Game(update=69)
 
+    def test_flat_fill_type_raise(self):
+        with self.assertRaisesRegex(TypeError, pyrenderlab.INVALID_FLAT_FILL_TYPE):
+            self.new_game = pyrenderlab.Game(flat_fill=69)
+
+    def test_light_direction_raise(self):
+        with self.assertRaisesRegex(ValueError, pyrenderlab.INVALID_LIGHT_DIRECTION):
+            self.new_game = pyrenderlab.Game(light_direction=(0, 0, 0))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -32,6 +32,13 @@ class TestCube(unittest.TestCase):
     def test_rotate(self):
         self.assertEqual(self.new_shape.angle_x, 69)
 
+    def test_triangulate(self):
+        triangles, solids, outlines = self.new_shape.triangulate()
+        triangle_indices = self.new_shape.triangle_indices
+        self.new_shape.triangulate()
+        self.assertEqual((triangles.shape, solids.shape, outlines.shape), ((12, 3, 2), (12, 3, 3), (12, 2, 2)))
+        self.assertIs(self.new_shape.triangle_indices, triangle_indices)
+
 
 class TestRaises(unittest.TestCase):
     def setUp(self):